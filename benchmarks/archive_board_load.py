@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: board-load time as completed-card history grows.
+
+For each history size, old cards are added to the 'Done' column and the board is
+loaded twice: once with the history still in 'tasks' (no archival) and once after
+archive_completed_cards() has moved it to 'tasks_archive'. With archival the load
+time should stay flat; without it, it grows with the history.
+
+Needs a running MongoDB (MONGO_URI, default mongodb://localhost:27017/). Uses a
+throwaway database (BENCH_MONGO_DATABASE, default 'todo_bench_archive') that is
+dropped at the start and end of the run.
+
+    python benchmarks/archive_board_load.py
+"""
+import os
+import sys
+import time
+import statistics
+from datetime import datetime, timedelta
+
+BENCH_DATABASE = os.environ.get('BENCH_MONGO_DATABASE', 'todo_bench_archive')
+os.environ['MONGO_DATABASE'] = BENCH_DATABASE
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'todo_app'))
+import app as todo_app  # noqa: E402
+
+BOARD_ID = 'default_board'
+HOT_CARDS_PER_COLUMN = 100
+HISTORY_STEPS = [0, 10000, 50000, 100000, 250000]
+LOAD_REPEATS = 20
+INSERT_CHUNK = 5000
+
+
+def time_board_load(client):
+    samples = []
+    for _ in range(LOAD_REPEATS):
+        start = time.perf_counter()
+        response = client.get(f'/api/board/{BOARD_ID}')
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_data(as_text=True)
+    return statistics.median(samples) * 1000
+
+
+def insert_old_done_cards(done_column_id, count, offset):
+    old = datetime.utcnow() - timedelta(days=todo_app.ARCHIVE_AGE_DAYS + 1)
+    for start in range(0, count, INSERT_CHUNK):
+        todo_app.tasks_collection.insert_many([{
+            'board_id': BOARD_ID,
+            'column_id': done_column_id,
+            'title': f'Old card {offset + i}',
+            'order': offset + i,
+            'task_id': f'Bench-{offset + i}',
+            'status': 'Done',
+            'priority': 'low',
+            'created_at': old,
+            'updated_at': old
+        } for i in range(start, min(start + INSERT_CHUNK, count))], ordered=False)
+
+
+def main():
+    todo_app.client.drop_database(BENCH_DATABASE)
+    todo_app.connect_to_mongodb()
+    client = todo_app.app.test_client()
+    client.get('/')  # Triggers default column creation
+
+    columns = {col['name']: str(col['_id']) for col in todo_app.columns_collection.find({'board_id': BOARD_ID})}
+    now = datetime.utcnow()
+    for column_id in columns.values():
+        todo_app.tasks_collection.insert_many([{
+            'board_id': BOARD_ID,
+            'column_id': column_id,
+            'title': f'Hot card {i}',
+            'order': i,
+            'task_id': f'Hot-{column_id}-{i}',
+            'priority': 'medium',
+            'created_at': now,
+            'updated_at': now
+        } for i in range(HOT_CARDS_PER_COLUMN)])
+
+    print(f"{'history':>10} {'no archival (ms)':>18} {'with archival (ms)':>20}")
+    inserted = 0
+    for history in HISTORY_STEPS:
+        insert_old_done_cards(columns['Done'], history - inserted, inserted)
+        inserted = history
+        hot_ms = time_board_load(client)
+
+        todo_app.archive_completed_cards()
+        archived_ms = time_board_load(client)
+
+        # Restore the history to 'tasks' so the next step measures the unarchived case again
+        restored = list(todo_app.archive_collection.find({}, {'archived_at': 0}))
+        if restored:
+            todo_app.archive_collection.delete_many({})
+            for start in range(0, len(restored), INSERT_CHUNK):
+                todo_app.tasks_collection.insert_many(restored[start:start + INSERT_CHUNK], ordered=False)
+
+        print(f"{history:>10} {hot_ms:>18.2f} {archived_ms:>20.2f}")
+
+    todo_app.client.drop_database(BENCH_DATABASE)
+
+
+if __name__ == '__main__':
+    main()
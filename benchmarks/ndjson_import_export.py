@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: NDJSON board import and export at scale.
+
+Generates an NDJSON file with BENCH_CARDS cards (default 1,000,000), streams it into
+POST /api/board/<id>/import, then streams GET /api/board/<id>/export back to disk.
+Reports throughput and the peak Python heap (tracemalloc) for each phase, which
+should stay flat regardless of BENCH_CARDS.
+
+Needs a running MongoDB (MONGO_URI, default mongodb://localhost:27017/). Uses a
+throwaway database (BENCH_MONGO_DATABASE, default 'todo_bench_ndjson') that is
+dropped at the start and end of the run.
+
+    BENCH_CARDS=1000000 python benchmarks/ndjson_import_export.py
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+
+BENCH_DATABASE = os.environ.get('BENCH_MONGO_DATABASE', 'todo_bench_ndjson')
+BENCH_CARDS = int(os.environ.get('BENCH_CARDS', '1000000'))
+os.environ['MONGO_DATABASE'] = BENCH_DATABASE
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'todo_app'))
+import app as todo_app  # noqa: E402
+
+BOARD_ID = 'bench_board'
+COLUMNS = ['Back Log', 'In Progress', 'Done']
+
+
+def write_source_file(path):
+    per_column = BENCH_CARDS // len(COLUMNS)
+    with open(path, 'w') as f:
+        f.write(json.dumps({'type': 'board', 'id': 'source_board'}) + '\n')
+        for index, name in enumerate(COLUMNS):
+            f.write(json.dumps({'type': 'column', 'id': f'col-{index}', 'name': name, 'order': index}) + '\n')
+            count = per_column + (BENCH_CARDS % len(COLUMNS) if index == len(COLUMNS) - 1 else 0)
+            for i in range(count):
+                f.write(json.dumps({
+                    'type': 'card',
+                    'id': f'card-{index}-{i}',
+                    'column_id': f'col-{index}',
+                    'title': f'Card {i}',
+                    'order': i,
+                    'assignee': 'bench',
+                    'due_date': '2026-01-01',
+                    'priority': ('low', 'medium', 'high')[i % 3]
+                }) + '\n')
+
+
+def run_import(client, path):
+    last = None
+    with open(path, 'rb') as f:
+        response = client.post(f'/api/board/{BOARD_ID}/import', input_stream=f,
+                               content_length=os.path.getsize(path),
+                               content_type='application/x-ndjson', buffered=False)
+        for line in response.response:
+            last = json.loads(line)
+            if last['type'] == 'progress' and last['cards_imported'] % 100000 == 0:
+                print(f"  imported {last['cards_imported']} cards")
+        response.close()
+    return last
+
+
+def run_export(client, path):
+    lines = 0
+    response = client.get(f'/api/board/{BOARD_ID}/export', buffered=False)
+    with open(path, 'wb') as f:
+        for chunk in response.response:
+            f.write(chunk if isinstance(chunk, bytes) else chunk.encode())
+            lines += 1
+    response.close()
+    return lines
+
+
+def measure(label, func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {elapsed:.1f}s, {BENCH_CARDS / elapsed:,.0f} cards/s, peak heap {peak / 1024 / 1024:.1f} MiB")
+    return result
+
+
+def main():
+    todo_app.client.drop_database(BENCH_DATABASE)
+    todo_app.connect_to_mongodb()
+    client = todo_app.app.test_client()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'source.ndjson')
+        exported = os.path.join(tmp, 'exported.ndjson')
+        write_source_file(source)
+        print(f"Source file: {BENCH_CARDS} cards, {os.path.getsize(source) / 1024 / 1024:.1f} MiB")
+
+        summary = measure('import', run_import, client, source)
+        print(f"  summary: {summary}")
+        lines = measure('export', run_export, client, exported)
+        print(f"  exported {lines} lines, {os.path.getsize(exported) / 1024 / 1024:.1f} MiB")
+
+    todo_app.client.drop_database(BENCH_DATABASE)
+
+
+if __name__ == '__main__':
+    main()
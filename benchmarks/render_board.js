@@ -0,0 +1,219 @@
+/*
+ * Benchmark: client render cost per interaction on a large board, without a browser.
+ *
+ * Runs BoardModel/BoardView from todo_app/static/js/kanban_board.js against a minimal
+ * in-memory DOM and compares the old path (reload the board data and rebuild every
+ * column and card after each change) with the incremental path (apply the change to
+ * the model and patch the affected nodes). Reports median time and DOM nodes created
+ * per interaction. Layout and paint are not measured, so a real browser widens the gap.
+ *
+ *     node benchmarks/render_board.js [cards]
+ */
+const path = require('path');
+const { BoardModel, BoardView } = require(path.join(__dirname, '..', 'todo_app', 'static', 'js', 'kanban_board.js'));
+
+const CARD_COUNT = parseInt(process.argv[2] || '5000', 10);
+const COLUMN_NAMES = ['Back Log', 'In Progress', 'Done'];
+const REPEATS = 50;
+
+let nodesCreated = 0;
+
+class FakeClassList {
+    constructor() {
+        this.names = new Set();
+    }
+    add(...names) {
+        names.forEach(name => this.names.add(name));
+    }
+    remove(...names) {
+        names.forEach(name => this.names.delete(name));
+    }
+    contains(name) {
+        return this.names.has(name);
+    }
+}
+
+class FakeElement {
+    constructor(tagName) {
+        nodesCreated++;
+        this.tagName = tagName.toUpperCase();
+        this.children = [];
+        this.parentNode = null;
+        this.dataset = {};
+        this.style = {};
+        this.classList = new FakeClassList();
+        this.text = '';
+    }
+    set textContent(value) {
+        this.children.forEach(child => { child.parentNode = null; });
+        this.children = [];
+        this.text = String(value);
+    }
+    get textContent() {
+        return this.text + this.children.map(child => child.textContent).join('');
+    }
+    set innerHTML(value) {
+        this.textContent = value;
+    }
+    detach(node) {
+        if (node.parentNode) {
+            node.parentNode.removeChild(node);
+        }
+    }
+    appendChild(node) {
+        this.detach(node);
+        this.children.push(node);
+        node.parentNode = this;
+        return node;
+    }
+    insertBefore(node, reference) {
+        if (reference == null) {
+            return this.appendChild(node);
+        }
+        this.detach(node);
+        this.children.splice(this.children.indexOf(reference), 0, node);
+        node.parentNode = this;
+        return node;
+    }
+    removeChild(node) {
+        this.children.splice(this.children.indexOf(node), 1);
+        node.parentNode = null;
+        return node;
+    }
+    querySelector(selector) {
+        const className = selector.slice(1);
+        for (const child of this.children) {
+            if (child.classList.contains(className)) {
+                return child;
+            }
+            const found = child.querySelector(selector);
+            if (found) {
+                return found;
+            }
+        }
+        return null;
+    }
+}
+
+const fakeDocument = { createElement: tagName => new FakeElement(tagName) };
+
+// get_board_data's sort, written independently of compareCards: priority, order, then ID, all descending
+const PRIORITY_RANK = { high: 3, medium: 2, low: 1 };
+function serverSort(cards) {
+    const key = card => [PRIORITY_RANK[card.priority] || 1, card.order || 0, card.id];
+    return cards.slice().sort((a, b) => {
+        const ka = key(a);
+        const kb = key(b);
+        for (let i = 0; i < ka.length; i++) {
+            if (ka[i] !== kb[i]) {
+                return ka[i] < kb[i] ? 1 : -1;
+            }
+        }
+        return 0;
+    });
+}
+
+// Cards as create_card stores them (ascending order per column, ObjectId-like IDs),
+// returned in get_board_data's shape and sort order
+function makeBoardData() {
+    const priorities = ['low', 'medium', 'high'];
+    const columns = COLUMN_NAMES.map((name, index) => ({ id: `col-${index}`, name: name, cards: [] }));
+    for (let i = 0; i < CARD_COUNT; i++) {
+        const column = columns[i % columns.length];
+        column.cards.push({
+            id: i.toString(16).padStart(24, '0'),
+            title: `Card ${i}`,
+            assignee: i % 2 ? 'alice' : null,
+            due_date: i % 3 ? '2026-01-01' : null,
+            task_id: `Task-${i + 1}`,
+            status: column.name,
+            priority: priorities[Math.floor(i / 7) % 3],
+            order: column.cards.length,
+            column_id: column.id
+        });
+    }
+    columns.forEach(column => { column.cards = serverSort(column.cards); });
+    return { id: 'bench_board', columns: columns };
+}
+
+// The model (and so the DOM) must list cards exactly as a reload from the server would
+function checkMatchesServer(model, view) {
+    model.columns.forEach(column => {
+        const expected = serverSort(column.cardIds.map(id => model.cards.get(id))).map(card => card.id);
+        const rendered = view.columnElements.get(column.id).children.slice(2).map(node => node.dataset.cardId);
+        if (expected.join() !== column.cardIds.join() || rendered.join() !== column.cardIds.join()) {
+            throw new Error(`Column ${column.name} does not match the server's sort order`);
+        }
+    });
+}
+
+function measure(label, interaction) {
+    const times = [];
+    let nodes = 0;
+    for (let i = 0; i < REPEATS; i++) {
+        const before = nodesCreated;
+        const start = process.hrtime.bigint();
+        interaction(i);
+        times.push(Number(process.hrtime.bigint() - start) / 1e6);
+        nodes += nodesCreated - before;
+    }
+    times.sort((a, b) => a - b);
+    const median = times[Math.floor(times.length / 2)];
+    console.log(`${label.padEnd(32)} ${median.toFixed(3).padStart(10)} ms ${Math.round(nodes / REPEATS).toString().padStart(10)} nodes`);
+    return median;
+}
+
+function main() {
+    const data = makeBoardData();
+    const json = JSON.stringify(data);
+    const model = new BoardModel();
+    const view = new BoardView(new FakeElement('div'), fakeDocument);
+    model.load(data);
+    view.render(model);
+
+    console.log(`Board: ${CARD_COUNT} cards in ${COLUMN_NAMES.length} columns, ${REPEATS} repeats each`);
+    console.log(`${'interaction'.padEnd(32)} ${'median'.padStart(13)} ${'created'.padStart(16)}`);
+
+    const full = measure('full re-render (old path)', () => {
+        model.load(JSON.parse(json));
+        view.render(model);
+    });
+
+    const move = measure('move card (patch)', i => {
+        const cardId = model.columns[0].cardIds[0];
+        model.moveCard(cardId, model.columns[(i % 2) + 1].id, 10);
+        view.placeCard(model, cardId);
+    });
+
+    const priority = measure('change priority (patch)', i => {
+        const cardId = model.columns[1].cardIds[i];
+        model.setPriority(cardId, ['low', 'medium', 'high'][i % 3]);
+        view.updateCard(model, cardId);
+        view.placeCard(model, cardId);
+    });
+
+    const add = measure('add card (patch)', i => {
+        const columnId = model.columns[0].id;
+        model.addCard(columnId, {
+            id: `new-${i}`,
+            title: `New card ${i}`,
+            task_id: null,
+            priority: 'low',
+            order: model.nextOrder(columnId)
+        });
+        view.insertCard(model, `new-${i}`);
+    });
+
+    const remove = measure('delete card (patch)', i => {
+        model.removeCard(`new-${i}`);
+        view.removeCard(`new-${i}`);
+    });
+
+    checkMatchesServer(model, view);
+    console.log('Model and DOM match the server sort order after all interactions.');
+
+    const slowest = Math.max(move, priority, add, remove);
+    console.log(`Slowest patch is ${(full / slowest).toFixed(0)}x faster than a full re-render.`);
+}
+
+main();
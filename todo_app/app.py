@@ -1,10 +1,19 @@
 # -*- coding: utf-8 -*-
 import os
+import io
+import json
+import math
 import logging
-from flask import Flask, render_template, jsonify, request
-from pymongo import MongoClient
+import socket
+import threading
+import time
+import uuid
+import click
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context
+from pymongo import MongoClient, ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from bson.objectid import ObjectId
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,6 +27,28 @@ app = Flask(__name__)
 MONGO_URI = os.environ.get('MONGO_URI', 'mongodb://localhost:27017/')
 MONGO_DATABASE = os.environ.get('MONGO_DATABASE', 'todo')
 
+# Archival settings: cards sitting in ARCHIVE_COLUMN_NAME for longer than
+# ARCHIVE_AGE_DAYS are moved from 'tasks' to 'tasks_archive' in batches.
+ARCHIVE_ENABLED = os.environ.get('ARCHIVE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+ARCHIVE_COLUMN_NAME = os.environ.get('ARCHIVE_COLUMN_NAME', 'Done')
+ARCHIVE_AGE_DAYS = float(os.environ.get('ARCHIVE_AGE_DAYS', '30'))
+ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', '500'))
+ARCHIVE_INTERVAL_SECONDS = int(os.environ.get('ARCHIVE_INTERVAL_SECONDS', '3600'))
+ARCHIVE_BATCH_PAUSE_SECONDS = float(os.environ.get('ARCHIVE_BATCH_PAUSE_SECONDS', '0.1'))  # Yield to foreground traffic between batches
+ARCHIVE_POLL_SECONDS = float(os.environ.get('ARCHIVE_POLL_SECONDS', '5'))  # How often an idle worker checks for requested runs
+ARCHIVE_LEASE_SECONDS = int(os.environ.get('ARCHIVE_LEASE_SECONDS', '300'))  # Single-runner lease, renewed every batch
+
+# NDJSON export/import settings: cursor batch size for export, cards per insert_many for import
+EXPORT_CURSOR_BATCH_SIZE = int(os.environ.get('EXPORT_CURSOR_BATCH_SIZE', '1000'))
+IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', '1000'))
+IMPORT_READ_BUFFER_SIZE = 1024 * 1024  # Bytes read from the request body at a time during import
+IMPORT_MAX_LINE_BYTES = int(os.environ.get('IMPORT_MAX_LINE_BYTES', str(64 * 1024)))  # Longer NDJSON lines are rejected
+
+# Moved cards get an order halfway between their neighbours. Repeated drops into the same
+# slot halve the gap each time, so once two cards of the same priority in a column are
+# closer than this, that group is renumbered with whole numbers.
+CARD_ORDER_MIN_GAP = 1e-6
+
 # Initialize MongoDB client and collection variables
 client = None
 db = None
@@ -25,13 +56,14 @@ tasks_collection = None
 boards_collection = None
 columns_collection = None
 counters_collection = None  # Add counters collection
+archive_collection = None  # Cold storage for archived cards
 
 def connect_to_mongodb():
     """
     Establish a connection to MongoDB and initialize the database and collections.
     This function handles connection errors and sets the global database and collection variables.
     """
-    global client, db, tasks_collection, boards_collection, columns_collection, counters_collection
+    global client, db, tasks_collection, boards_collection, columns_collection, counters_collection, archive_collection
     try:
         # Explicitly set timeoutMS to handle potential network delays during connection
         client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000) # 5 second timeout
@@ -43,8 +75,10 @@ def connect_to_mongodb():
         boards_collection = db['boards'] # Although not used in add column, good practice to initialize
         columns_collection = db['columns']
         counters_collection = db['counters']  # Initialize counters collection
+        archive_collection = db['tasks_archive']
         logging.info(f"Using database: {MONGO_DATABASE}")
-        logging.info(f"Collections initialized: tasks={tasks_collection is not None}, boards={boards_collection is not None}, columns={columns_collection is not None}, counters={counters_collection is not None}")
+        logging.info(f"Collections initialized: tasks={tasks_collection is not None}, boards={boards_collection is not None}, columns={columns_collection is not None}, counters={counters_collection is not None}, archive={archive_collection is not None}")
+        ensure_indexes()
     except Exception as e:
         # Mask credentials in log output if they exist in the URI
         safe_uri = MONGO_URI.split('@')[-1] if '@' in MONGO_URI else MONGO_URI
@@ -56,9 +90,228 @@ def connect_to_mongodb():
         boards_collection = None
         columns_collection = None
         counters_collection = None
+        archive_collection = None
         # IMPORTANT: Raise the exception to halt app initialization if DB connection is critical
         raise ConnectionError(f"Could not connect to MongoDB: {e}")
 
+def ensure_indexes():
+    """
+    Create the indexes the board read and the archiver rely on.
+    Failures are logged but not fatal, since the app still works without them (only slower).
+    """
+    try:
+        # Board reads look up hot cards per column; the archiver scans a column by age
+        tasks_collection.create_index([('column_id', ASCENDING), ('order', ASCENDING)])
+        tasks_collection.create_index([('column_id', ASCENDING), ('updated_at', ASCENDING)])
+        tasks_collection.create_index([('column_id', ASCENDING), ('created_at', ASCENDING)])
+        # Counter and lease documents are looked up by name; uniqueness keeps the archive lease exclusive
+        counters_collection.create_index('name', unique=True)
+        # Archive pages are served newest first per board
+        archive_collection.create_index([('board_id', ASCENDING), ('archived_at', DESCENDING), ('_id', DESCENDING)])
+        logging.info("Indexes ensured for tasks and tasks_archive collections.")
+    except Exception as e:
+        logging.error(f"Failed to ensure indexes: {e}")
+
+
+ARCHIVE_LEASE_NAME = 'archive_lease'
+archive_worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+def acquire_archive_lease():
+    """
+    Take or renew the lease that allows a single process to run the archiver.
+
+    The lease is a document in 'counters'. It can be taken over once it has expired,
+    so a crashed worker does not block archival for longer than ARCHIVE_LEASE_SECONDS.
+
+    Returns:
+        bool: True if this process holds the lease.
+    """
+    now = datetime.utcnow()
+    try:
+        counters_collection.find_one_and_update(
+            {'name': ARCHIVE_LEASE_NAME, '$or': [{'owner': archive_worker_id}, {'expires_at': {'$lt': now}}, {'owner': None}]},
+            {'$set': {'owner': archive_worker_id, 'expires_at': now + timedelta(seconds=ARCHIVE_LEASE_SECONDS)}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # Another live process holds the lease, so the upsert collided with its document
+        return False
+
+
+def release_archive_lease():
+    """
+    Give up the archive lease if this process holds it.
+    """
+    counters_collection.update_one(
+        {'name': ARCHIVE_LEASE_NAME, 'owner': archive_worker_id},
+        {'$set': {'owner': None, 'expires_at': None}}
+    )
+
+
+def request_archive_run():
+    """
+    Ask the archive worker to run now. Works across processes, because the request
+    is stored on the lease document that every worker polls.
+    """
+    counters_collection.update_one({'name': ARCHIVE_LEASE_NAME}, {'$set': {'run_requested': True}}, upsert=True)
+    archive_wake_event.set()
+
+
+def archive_completed_cards(now=None):
+    """
+    Move cards that have been in the archive column longer than ARCHIVE_AGE_DAYS
+    from 'tasks' into 'tasks_archive', ARCHIVE_BATCH_SIZE cards at a time.
+
+    A card's age is taken from 'updated_at' (set when it was last moved or edited)
+    and falls back to 'created_at' for cards that were never changed. Each batch is
+    copied before it is deleted, and re-copying an already archived card is ignored,
+    so an interrupted run is safe to repeat. Each delete repeats the age/column
+    predicate, and the archive copy of any card that was not deleted by this pass
+    (changed or deleted by a user in the meantime) is removed again.
+
+    Args:
+        now (datetime, optional): Reference time for the age cutoff. Defaults to utcnow().
+
+    Returns:
+        int: The number of cards archived.
+    """
+    if tasks_collection is None or columns_collection is None or archive_collection is None:
+        logging.error("Archival skipped: Database connection failed.")
+        return 0
+
+    cutoff = (now or datetime.utcnow()) - timedelta(days=ARCHIVE_AGE_DAYS)
+    column_ids = [str(col['_id']) for col in columns_collection.find({'name': ARCHIVE_COLUMN_NAME}, {'_id': 1})]
+    if not column_ids:
+        logging.debug(f"Archival skipped: No '{ARCHIVE_COLUMN_NAME}' columns found.")
+        return 0
+
+    query = {
+        'column_id': {'$in': column_ids},
+        '$or': [
+            {'updated_at': {'$lt': cutoff}},
+            {'updated_at': None, 'created_at': {'$lt': cutoff}}
+        ]
+    }
+
+    archived_total = 0
+    while True:
+        if not acquire_archive_lease():
+            logging.warning("Archival stopped: Another process took over the archive lease.")
+            break
+        batch = list(tasks_collection.find(query).limit(ARCHIVE_BATCH_SIZE))
+        if not batch:
+            break
+
+        archived_at = datetime.utcnow()
+        for task in batch:
+            task['archived_at'] = archived_at
+
+        try:
+            archive_collection.insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            # Duplicate keys mean a previous run copied these cards but did not delete them yet
+            other_errors = [err for err in e.details.get('writeErrors', []) if err.get('code') != 11000]
+            if other_errors:
+                raise
+
+        # Delete card by card, repeating the age/column predicate, so we know exactly
+        # which cards this pass removed. Cards moved, edited or deleted by a user since
+        # the find are not removed here, and their archive copies are dropped below.
+        not_archived_ids = []
+        for task in batch:
+            if tasks_collection.delete_one(dict(query, _id=task['_id'])).deleted_count == 0:
+                not_archived_ids.append(task['_id'])
+        if not_archived_ids:
+            archive_collection.delete_many({'_id': {'$in': not_archived_ids}})
+            logging.info(f"Skipped archiving {len(not_archived_ids)} cards that changed or were deleted during archival.")
+        archived_total += len(batch) - len(not_archived_ids)
+        logging.debug(f"Archived batch of {len(batch) - len(not_archived_ids)} cards.")
+
+        if len(batch) < ARCHIVE_BATCH_SIZE:
+            break
+        time.sleep(ARCHIVE_BATCH_PAUSE_SECONDS)
+
+    if archived_total:
+        logging.info(f"Archived {archived_total} cards from '{ARCHIVE_COLUMN_NAME}' older than {cutoff.isoformat()}.")
+    return archived_total
+
+
+def wait_for_next_archive_run(stop_event, wake_event):
+    """
+    Sleep until ARCHIVE_INTERVAL_SECONDS have passed, wake_event is set, or a run
+    has been requested through the lease document, whichever comes first.
+    """
+    deadline = time.monotonic() + ARCHIVE_INTERVAL_SECONDS
+    while not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if wake_event.wait(min(remaining, ARCHIVE_POLL_SECONDS)):
+            wake_event.clear()
+            return
+        try:
+            if counters_collection.find_one({'name': ARCHIVE_LEASE_NAME, 'run_requested': True}, {'_id': 1}):
+                return
+        except Exception as e:
+            logging.error(f"Error checking for requested archive runs: {e}")
+
+
+def archive_worker(stop_event, wake_event):
+    """
+    Loop that runs archive_completed_cards every ARCHIVE_INTERVAL_SECONDS, or sooner
+    when a run is requested, until stop_event is set. Only the process holding the
+    archive lease does any work; the others wait for it to expire.
+    """
+    logging.info(f"Archive worker {archive_worker_id} started (column='{ARCHIVE_COLUMN_NAME}', age={ARCHIVE_AGE_DAYS} days, batch={ARCHIVE_BATCH_SIZE}, interval={ARCHIVE_INTERVAL_SECONDS}s).")
+    while not stop_event.is_set():
+        try:
+            if acquire_archive_lease():
+                counters_collection.update_one({'name': ARCHIVE_LEASE_NAME}, {'$set': {'run_requested': False}})
+                archive_completed_cards()
+            else:
+                logging.debug("Archive lease held by another process; skipping this run.")
+        except Exception as e:
+            logging.error(f"Error during card archival: {e}", exc_info=True)
+        wait_for_next_archive_run(stop_event, wake_event)
+    try:
+        release_archive_lease()
+    except Exception as e:
+        logging.error(f"Error releasing archive lease: {e}")
+    logging.info(f"Archive worker {archive_worker_id} stopped.")
+
+
+archive_stop_event = threading.Event()
+archive_wake_event = threading.Event()
+archive_thread = None
+
+def start_archive_worker():
+    """
+    Start the archive worker as a daemon thread, unless it is disabled or already running.
+    This is not done on import; call it from the process that should archive
+    (see __main__ below and the 'archive-worker' CLI command).
+    """
+    global archive_thread
+    if not ARCHIVE_ENABLED or (archive_thread is not None and archive_thread.is_alive()):
+        return
+    archive_thread = threading.Thread(target=archive_worker, args=(archive_stop_event, archive_wake_event), name='archive-worker', daemon=True)
+    archive_thread.start()
+
+
+@app.cli.command('archive-worker')
+def archive_worker_command():
+    """
+    Run the archive worker in the foreground, for deployments where the web
+    server runs the app without executing this module as __main__.
+    """
+    click.echo(f"Archive worker {archive_worker_id} running; press Ctrl+C to stop.")
+    try:
+        archive_worker(archive_stop_event, archive_wake_event)
+    except KeyboardInterrupt:
+        archive_stop_event.set()
+        release_archive_lease()
+
+
 # Call connect_to_mongodb when the app starts
 try:
     connect_to_mongodb()
@@ -128,6 +381,27 @@ def ensure_default_columns():
         # For now, we just log the error. Consider implications if defaults MUST exist.
 
 
+def card_to_json(task, column=None):
+    """
+    Convert a task document into the card format used by the board API.
+
+    Every endpoint that returns cards goes through this function so they all agree.
+    When the card's column document is given, its name and ID are used for 'status'
+    and 'column_id' instead of the values stored on the card.
+    """
+    return {
+        'id': str(task['_id']),
+        'title': task.get('title', 'No Title'),
+        'assignee': task.get('assignee'),
+        'due_date': task['due_date'].strftime('%Y-%m-%d') if task.get('due_date') else None,
+        'task_id': task.get('task_id'),
+        'status': column['name'] if column else task.get('status'),
+        'priority': task.get('priority', 'low'),
+        'order': task.get('order', 0),
+        'column_id': str(column['_id']) if column else task.get('column_id')
+    }
+
+
 @app.route('/api/board/<string:board_id>', methods=['GET'])
 def get_board_data(board_id):
     """
@@ -162,23 +436,15 @@ def get_board_data(board_id):
             logging.debug(f"Fetching tasks for column_id: {column_id_str} (Name: {column['name']})")
             tasks = list(tasks_collection.find({'column_id': column_id_str}))
 
-            # Apply priority mapping for sorting
-            tasks.sort(key=lambda task: (priority_map.get(task.get('priority', 'low'), 1), task['order']), reverse=True)
+            # Apply priority mapping for sorting; the card ID breaks ties so the client can reproduce this order
+            tasks.sort(key=lambda task: (priority_map.get(task.get('priority', 'low'), 1), task['order'], str(task['_id'])), reverse=True)
 
             logging.debug(f"Found {len(tasks)} tasks for column '{column['name']}'.")
 
             board_data['columns'].append({
                 'id': column_id_str,
                 'name': column['name'],
-                'cards': [{
-                    'id': str(task['_id']),
-                    'title': task.get('title', 'No Title'),
-                    'assignee': task.get('assignee'),
-                    'due_date': task['due_date'].strftime('%Y-%m-%d') if task.get('due_date') else None,
-                    'task_id': task.get('task_id'),
-                    'status': column['name'],
-                    'priority': task.get('priority', 'low')
-                } for task in tasks]
+                'cards': [card_to_json(task, column) for task in tasks]
             })
 
         logging.info(f"Successfully retrieved data for board '{board_id}'.")
@@ -189,6 +455,428 @@ def get_board_data(board_id):
         return jsonify({'error': f'Failed to fetch board data: {e}'}), 500
 
 
+@app.route('/api/board/<string:board_id>/archive', methods=['GET'])
+def get_archived_cards(board_id):
+    """
+    Retrieve archived cards for a board, newest archived first, one page at a time.
+
+    Accepts optional 'page_size' (default 50, max 500) and 'before' query parameters.
+    'before' is the 'next_before' value from the previous page. Pages are read with
+    keyset pagination on the (board_id, archived_at, _id) index, so deep pages cost
+    the same as the first one.
+
+    Args:
+        board_id (str): The ID of the board whose archive to retrieve.
+
+    Returns:
+        jsonify: A JSON response containing the page of archived cards or an error message.
+    """
+    if archive_collection is None:
+        logging.error(f"get_archived_cards failed for board '{board_id}': Database connection failed.")
+        return jsonify({'error': 'Database connection failed'}), 500
+
+    try:
+        page_size = int(request.args.get('page_size', 50))
+    except ValueError:
+        logging.warning(f"Archive fetch failed for board '{board_id}': Invalid page_size.")
+        return jsonify({'error': 'page_size must be an integer'}), 400
+
+    if page_size < 1 or page_size > 500:
+        logging.warning(f"Archive fetch failed for board '{board_id}': page_size={page_size} out of range.")
+        return jsonify({'error': 'page_size must be between 1 and 500'}), 400
+
+    query = {'board_id': board_id}
+    before = request.args.get('before')
+    if before:
+        # Cursor format: '<archived_at ISO timestamp>_<card ObjectId>'
+        try:
+            before_archived_at_str, before_id_str = before.rsplit('_', 1)
+            before_archived_at = datetime.fromisoformat(before_archived_at_str)
+            before_id = ObjectId(before_id_str)
+        except (ValueError, bson.errors.InvalidId):
+            logging.warning(f"Archive fetch failed for board '{board_id}': Invalid cursor '{before}'.")
+            return jsonify({'error': 'Invalid before cursor'}), 400
+        query['$or'] = [
+            {'archived_at': {'$lt': before_archived_at}},
+            {'archived_at': before_archived_at, '_id': {'$lt': before_id}}
+        ]
+
+    logging.info(f"Fetching archived cards for board_id: {board_id} (before {before}, page_size {page_size})")
+    try:
+        # Fetch one extra document to find out if another page exists without counting the whole archive
+        tasks = list(archive_collection.find(query)
+                     .sort([('archived_at', DESCENDING), ('_id', DESCENDING)])
+                     .limit(page_size + 1))
+        has_more = len(tasks) > page_size
+        tasks = tasks[:page_size]
+        next_before = f"{tasks[-1]['archived_at'].isoformat()}_{tasks[-1]['_id']}" if has_more else None
+
+        return jsonify({
+            'board_id': board_id,
+            'page_size': page_size,
+            'has_more': has_more,
+            'next_before': next_before,
+            'cards': [dict(card_to_json(task),
+                           archived_at=task['archived_at'].isoformat() if task.get('archived_at') else None)
+                      for task in tasks]
+        })
+
+    except Exception as e:
+        logging.error(f"Error fetching archived cards for board '{board_id}': {e}", exc_info=True)
+        return jsonify({'error': f'Failed to fetch archived cards: {e}'}), 500
+
+
+@app.route('/api/archive/run', methods=['POST'])
+def run_archive():
+    """
+    Ask the archive worker to run now instead of waiting for its next interval.
+    The archival itself happens in the worker, so this returns immediately.
+
+    Returns:
+        jsonify: A 202 JSON response once the run has been requested.
+    """
+    logging.info("Received request to run card archival.")
+
+    if counters_collection is None:
+        logging.error("Cannot request card archival: Database connection failed.")
+        return jsonify({'error': 'Database connection failed'}), 500
+
+    try:
+        request_archive_run()
+        return jsonify({'success': True, 'message': 'Archival requested'}), 202
+    except Exception as e:
+        logging.error(f"Error requesting card archival: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': f'Failed to request archival: {e}'}), 500
+
+
+@app.route('/api/board/<string:board_id>/export', methods=['GET'])
+def export_board(board_id):
+    """
+    Stream a board as NDJSON: one 'board' record, then each column followed by its cards,
+    then the board's archived cards as 'archived_card' records, oldest archived first.
+
+    Cards are read from a MongoDB cursor in EXPORT_CURSOR_BATCH_SIZE batches and written
+    out as they arrive, so memory use does not grow with the size of the board.
+
+    Args:
+        board_id (str): The ID of the board to export.
+
+    Returns:
+        Response: An application/x-ndjson streaming response or a JSON error message.
+    """
+    if columns_collection is None or tasks_collection is None or archive_collection is None:
+        logging.error(f"export_board failed for board '{board_id}': Database connection failed.")
+        return jsonify({'error': 'Database connection failed'}), 500
+
+    logging.info(f"Exporting board '{board_id}' as NDJSON.")
+
+    def generate():
+        column_count = 0
+        card_count = 0
+        archived_count = 0
+        try:
+            yield json.dumps({'type': 'board', 'id': board_id}) + '\n'
+            # Columns are few; read them up front so no cursor is held open while cards stream
+            columns = list(columns_collection.find({'board_id': board_id}).sort('order'))
+            for column in columns:
+                column_id_str = str(column['_id'])
+                yield json.dumps({
+                    'type': 'column',
+                    'id': column_id_str,
+                    'name': column['name'],
+                    'order': column.get('order', 0)
+                }) + '\n'
+                column_count += 1
+
+                cursor = tasks_collection.find({'column_id': column_id_str}).sort('order').batch_size(EXPORT_CURSOR_BATCH_SIZE)
+                for task in cursor:
+                    yield json.dumps({
+                        'type': 'card',
+                        **card_to_json(task, column),
+                        'created_at': task['created_at'].isoformat() if task.get('created_at') else None,
+                        'updated_at': task['updated_at'].isoformat() if task.get('updated_at') else None
+                    }) + '\n'
+                    card_count += 1
+
+            # Archived cards come last: their column may since have been deleted, and every
+            # column record they can refer to has been written by now
+            cursor = (archive_collection.find({'board_id': board_id})
+                      .sort([('archived_at', ASCENDING), ('_id', ASCENDING)])
+                      .batch_size(EXPORT_CURSOR_BATCH_SIZE))
+            for task in cursor:
+                yield json.dumps({
+                    'type': 'archived_card',
+                    **card_to_json(task),
+                    'created_at': task['created_at'].isoformat() if task.get('created_at') else None,
+                    'updated_at': task['updated_at'].isoformat() if task.get('updated_at') else None,
+                    'archived_at': task['archived_at'].isoformat() if task.get('archived_at') else None
+                }) + '\n'
+                archived_count += 1
+            logging.info(f"Exported board '{board_id}': {column_count} columns, {card_count} cards, {archived_count} archived cards.")
+        except Exception as e:
+            # Headers are already sent, so the error can only be logged and the stream cut short
+            logging.error(f"Error exporting board '{board_id}' after {card_count} cards: {e}", exc_info=True)
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'Content-Disposition': f'attachment; filename={board_id}.ndjson'})
+
+
+def parse_import_timestamp(record, field, default):
+    """
+    Parse an ISO 8601 timestamp field of an imported record, or return default if it is empty.
+
+    Raises:
+        ValueError: If the field is set but is not a valid ISO 8601 timestamp.
+    """
+    if not record.get(field):
+        return default
+    if not isinstance(record[field], str):
+        raise ValueError(f"Invalid {field} value '{record[field]}'")
+    try:
+        return datetime.fromisoformat(record[field])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {field} value '{record[field]}'")
+
+
+def parse_import_card(record, board_id, column_id, status):
+    """
+    Build a task document from an imported 'card' or 'archived_card' record.
+
+    Timestamps missing from the record default to the time of the import.
+
+    Raises:
+        ValueError: If the record is missing a title, has a field of the wrong type,
+            or has an invalid priority or date.
+    """
+    title = record.get('title')
+    if not title:
+        raise ValueError('Title is required')
+    if not isinstance(title, str):
+        raise ValueError('Title must be a string')
+
+    assignee = record.get('assignee') or None
+    if assignee is not None and not isinstance(assignee, str):
+        raise ValueError('Assignee must be a string')
+
+    priority = record.get('priority') or 'low'
+    if not isinstance(priority, str) or priority not in ['low', 'medium', 'high']:
+        raise ValueError(f"Invalid priority value '{priority}'")
+
+    due_date = None
+    if record.get('due_date'):
+        if not isinstance(record['due_date'], str):
+            raise ValueError(f"Invalid date format '{record['due_date']}'. Please use YYYY-MM-DD")
+        try:
+            due_date = datetime.strptime(record['due_date'], '%Y-%m-%d')
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date format '{record['due_date']}'. Please use YYYY-MM-DD")
+
+    now = datetime.utcnow()
+    created_at = parse_import_timestamp(record, 'created_at', now)
+    updated_at = parse_import_timestamp(record, 'updated_at', now)
+
+    return {
+        'board_id': board_id,
+        'column_id': column_id,
+        'title': title,
+        'assignee': assignee,
+        'due_date': due_date,
+        'status': status,
+        'priority': priority,
+        'created_at': created_at,
+        'updated_at': updated_at
+    }
+
+
+@app.route('/api/board/<string:board_id>/import', methods=['POST'])
+def import_board(board_id):
+    """
+    Import columns and cards into a board from an NDJSON request body, as produced by export_board.
+
+    'column' records are matched to existing columns of the board by name and created
+    if missing. 'card' records must come after the column they reference and are inserted
+    IMPORT_CHUNK_SIZE at a time with insert_many(ordered=False). Each chunk reserves a
+    block of Task IDs with a single counter update. 'archived_card' records are inserted
+    the same way into tasks_archive, keeping their status and archived_at; their column
+    is mapped like a card's when it was exported, and left unset otherwise. 'board'
+    records are ignored.
+
+    The body is read one line at a time, and lines longer than IMPORT_MAX_LINE_BYTES are
+    skipped with an error rather than buffered, so a body without newlines cannot exhaust
+    memory.
+
+    The response is itself NDJSON: a 'progress' record after every chunk, an 'error'
+    record for each line that could not be imported, and a final 'summary' record.
+
+    Args:
+        board_id (str): The ID of the board to import into.
+
+    Returns:
+        Response: An application/x-ndjson streaming response or a JSON error message.
+    """
+    logging.info(f"Received request to import NDJSON into board '{board_id}'.")
+
+    if tasks_collection is None or counters_collection is None or columns_collection is None or archive_collection is None:
+        logging.error(f"Cannot import into board '{board_id}': Database connection failed.")
+        return jsonify({'error': 'Database connection failed'}), 500
+
+    # request.stream is an unbuffered raw stream; reading lines from it directly reads one byte at a time
+    stream = io.BufferedReader(request.stream, buffer_size=IMPORT_READ_BUFFER_SIZE)
+
+    def insert_chunk(collection, chunk, stats, imported_key):
+        # Reserve a contiguous block of task numbers for the whole chunk
+        counter_doc = counters_collection.find_one_and_update(
+            {'name': 'task_counter'},
+            {'$inc': {'seq': len(chunk)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        first_number = counter_doc['seq'] - len(chunk) + 1
+        for offset, card_doc in enumerate(chunk):
+            card_doc['task_id'] = f"Task-{first_number + offset}"
+
+        try:
+            result = collection.insert_many(chunk, ordered=False)
+            stats[imported_key] += len(result.inserted_ids)
+        except BulkWriteError as e:
+            stats[imported_key] += e.details.get('nInserted', 0)
+            stats['errors'] += len(e.details.get('writeErrors', []))
+            logging.warning(f"Import into board '{board_id}': {len(e.details.get('writeErrors', []))} cards failed to insert.")
+
+    def generate():
+        stats = {'lines_read': 0, 'columns_created': 0, 'columns_matched': 0, 'cards_imported': 0,
+                 'archived_cards_imported': 0, 'errors': 0}
+
+        def error(message):
+            stats['errors'] += 1
+            return json.dumps({'type': 'error', 'line': stats['lines_read'], 'error': message}) + '\n'
+
+        try:
+            columns_by_name = {col['name']: col for col in columns_collection.find({'board_id': board_id})}
+            last_column = columns_collection.find_one({'board_id': board_id}, sort=[('order', -1)])
+            next_column_order = (last_column['order'] + 1) if last_column else 0
+            # Exported column ID -> (target column document, target column ID)
+            column_map = {}
+            # Target column ID -> next card order, so imported cards land after existing ones
+            next_card_order = {}
+            chunk = []
+            archive_chunk = []
+
+            while True:
+                raw_line = stream.readline(IMPORT_MAX_LINE_BYTES + 1)
+                if not raw_line:
+                    break
+                stats['lines_read'] += 1
+                if len(raw_line) > IMPORT_MAX_LINE_BYTES and not raw_line.endswith(b'\n'):
+                    # Discard the rest of the line a bounded read at a time
+                    while raw_line and not raw_line.endswith(b'\n'):
+                        raw_line = stream.readline(IMPORT_MAX_LINE_BYTES + 1)
+                    yield error(f'Line is longer than {IMPORT_MAX_LINE_BYTES} bytes')
+                    continue
+                line = raw_line.strip()
+                if not line:
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield error(f'Invalid JSON: {e}')
+                    continue
+                if not isinstance(record, dict):
+                    yield error('Each line must be a JSON object')
+                    continue
+
+                record_type = record.get('type')
+                if record_type == 'board':
+                    continue
+
+                elif record_type == 'column':
+                    name = record.get('name')
+                    if not name or record.get('id') is None:
+                        yield error("Column records require 'id' and 'name'")
+                        continue
+                    if not isinstance(name, str):
+                        yield error('Column name must be a string')
+                        continue
+                    column = columns_by_name.get(name)
+                    if column:
+                        stats['columns_matched'] += 1
+                    else:
+                        column = {'board_id': board_id, 'name': name, 'order': next_column_order}
+                        column['_id'] = columns_collection.insert_one(column).inserted_id
+                        columns_by_name[name] = column
+                        next_column_order += 1
+                        stats['columns_created'] += 1
+                    column_id_str = str(column['_id'])
+                    if column_id_str not in next_card_order:
+                        last_card = tasks_collection.find_one({'column_id': column_id_str}, sort=[('order', -1)])
+                        next_card_order[column_id_str] = (last_card['order'] + 1) if last_card else 0
+                    column_map[str(record['id'])] = (column, column_id_str)
+
+                elif record_type == 'card':
+                    target = column_map.get(str(record.get('column_id')))
+                    if target is None:
+                        yield error(f"Card references unknown column '{record.get('column_id')}'")
+                        continue
+                    column, column_id_str = target
+                    try:
+                        card_doc = parse_import_card(record, board_id, column_id_str, column['name'])
+                    except ValueError as e:
+                        yield error(str(e))
+                        continue
+                    card_doc['order'] = next_card_order[column_id_str]
+                    next_card_order[column_id_str] += 1
+                    chunk.append(card_doc)
+
+                    if len(chunk) >= IMPORT_CHUNK_SIZE:
+                        insert_chunk(tasks_collection, chunk, stats, 'cards_imported')
+                        chunk = []
+                        logging.info(f"Import into board '{board_id}': {stats['cards_imported']} cards imported so far.")
+                        yield json.dumps(dict(stats, type='progress')) + '\n'
+
+                elif record_type == 'archived_card':
+                    target = column_map.get(str(record.get('column_id')))
+                    column_id_str = target[1] if target else None
+                    status = record.get('status') or (target[0]['name'] if target else None)
+                    order = record.get('order', 0)
+                    try:
+                        if not isinstance(status, (str, type(None))):
+                            raise ValueError('Status must be a string')
+                        if isinstance(order, bool) or not isinstance(order, (int, float)) or not math.isfinite(order):
+                            raise ValueError(f"Invalid order value '{order}'")
+                        card_doc = parse_import_card(record, board_id, column_id_str, status)
+                        card_doc['archived_at'] = parse_import_timestamp(record, 'archived_at', datetime.utcnow())
+                    except ValueError as e:
+                        yield error(str(e))
+                        continue
+                    card_doc['order'] = order
+                    archive_chunk.append(card_doc)
+
+                    if len(archive_chunk) >= IMPORT_CHUNK_SIZE:
+                        insert_chunk(archive_collection, archive_chunk, stats, 'archived_cards_imported')
+                        archive_chunk = []
+                        logging.info(f"Import into board '{board_id}': {stats['archived_cards_imported']} archived cards imported so far.")
+                        yield json.dumps(dict(stats, type='progress')) + '\n'
+
+                else:
+                    yield error(f"Unknown record type '{record_type}'")
+
+            if chunk:
+                insert_chunk(tasks_collection, chunk, stats, 'cards_imported')
+            if archive_chunk:
+                insert_chunk(archive_collection, archive_chunk, stats, 'archived_cards_imported')
+
+        except Exception as e:
+            logging.error(f"Error importing into board '{board_id}' at line {stats['lines_read']}: {e}", exc_info=True)
+            yield error(f'Import aborted: {e}')
+            return
+
+        logging.info(f"Import into board '{board_id}' complete: {stats}")
+        yield json.dumps(dict(stats, type='summary')) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @app.route('/api/boards/<string:board_id>/columns', methods=['POST'])
 def create_column(board_id):
     """
@@ -365,24 +1053,11 @@ def create_card(column_id):
 
         logging.info(f"Successfully created card '{title}' (ID: {new_card_id}) in column '{column_id}' (Board: {board_id}, TaskID: {task_id}, Order: {new_order}, Priority: {priority}).")
 
-        # Return the full card data as created
-        # Prepare the card data for JSON response (e.g., format date)
-        response_card = {
-             'id': new_card_id,
-             'title': title,
-             'assignee': assignee if assignee else None,
-             'due_date': due_date.strftime('%Y-%m-%d') if due_date else None,
-             'task_id': task_id,
-             'status': target_column['name'],
-             'priority': priority,
-             'order': new_order, # Include order if frontend needs it
-             'column_id': column_id # Include column_id if frontend needs it
-        }
-
+        # Return the full card data as created (insert_one has set its _id)
         return jsonify({
             'success': True,
             'message': 'Card created successfully',
-            'card': response_card # Send back the created card data
+            'card': card_to_json(new_card_doc, target_column) # Send back the created card data
             }), 201
 
     # Specific exception for invalid ObjectId format
@@ -419,20 +1094,19 @@ def update_card_priority(card_id):
         return jsonify({'success': False, 'error': 'Invalid priority value. Must be low, medium, or high.'}), 400
 
     try:
-        result = tasks_collection.update_one(
+        task = tasks_collection.find_one_and_update(
             {'_id': ObjectId(card_id)},
-            {'$set': {'priority': priority}}
+            {'$set': {'priority': priority, 'updated_at': datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.matched_count == 0:
+        if task is None:
             logging.error(f"Priority update failed: Card with ID '{card_id}' not found.")
             return jsonify({'success': False, 'error': 'Card not found'}), 404
-        elif result.modified_count > 0:
-            logging.info(f"Successfully updated priority for card '{card_id}' to '{priority}'.")
-            return jsonify({'success': True, 'message': 'Priority updated successfully'})
-        else:
-            logging.info(f"Card '{card_id}' priority was already set to '{priority}'.")
-            return jsonify({'success': True, 'message': 'Priority already set to the specified value'})
+
+        logging.info(f"Successfully updated priority for card '{card_id}' to '{priority}'.")
+        # Return the stored card so the client can reconcile its copy
+        return jsonify({'success': True, 'message': 'Priority updated successfully', 'card': card_to_json(task)})
 
     except bson.errors.InvalidId:
         logging.error(f"Priority update failed: Invalid card_id format '{card_id}'.")
@@ -442,12 +1116,50 @@ def update_card_priority(card_id):
         return jsonify({'success': False, 'error': f'Failed to update priority: {e}'}), 500
 
 
+def renumber_crowded_orders(task):
+    """
+    Renumber the task's priority group in its column if the task's order is within
+    CARD_ORDER_MIN_GAP of another card in the group.
+
+    The group gets the orders 0, 1, 2, ... in its current sort order (order, then card
+    ID), so the board still shows it the same way.
+
+    Returns:
+        list: {'id', 'order'} for every card whose order changed; empty if none did.
+    """
+    priority = task.get('priority', 'low')
+    # Cards without a priority sort as 'low'
+    group_query = {
+        'column_id': task['column_id'],
+        'priority': {'$in': [priority, None]} if priority == 'low' else priority
+    }
+    crowded = tasks_collection.find_one(dict(group_query, **{
+        '_id': {'$ne': task['_id']},
+        'order': {'$gte': task['order'] - CARD_ORDER_MIN_GAP, '$lte': task['order'] + CARD_ORDER_MIN_GAP}
+    }))
+    if crowded is None:
+        return []
+
+    group = list(tasks_collection.find(group_query, {'order': 1}))
+    group.sort(key=lambda card: (card.get('order', 0), str(card['_id'])))
+    renumbered = [{'id': str(card['_id']), 'order': index}
+                  for index, card in enumerate(group) if card.get('order', 0) != index]
+    if renumbered:
+        tasks_collection.bulk_write([UpdateOne({'_id': ObjectId(card['id'])}, {'$set': {'order': card['order']}})
+                                     for card in renumbered], ordered=False)
+    logging.info(f"Renumbered {len(renumbered)} '{priority}' cards in column '{task['column_id']}' after orders got closer than {CARD_ORDER_MIN_GAP}.")
+    return renumbered
+
+
 @app.route('/api/cards/<string:card_id>/move', methods=['POST'])
 def move_card(card_id):
     """
     Move a card to a different column and update its order and status.
 
-    Expects 'new_column_id', 'new_order' in form data.
+    Expects 'new_column_id', 'new_order' in form data. 'new_order' may be fractional;
+    cards are shown by priority, then order, both descending (see get_board_data).
+    If the new order leaves the card too close to a neighbour, its priority group is
+    renumbered and the new orders are returned in 'renumbered'.
 
     Args:
         card_id (str): The ID of the card to move.
@@ -475,10 +1187,14 @@ def move_card(card_id):
          return jsonify({'success': False, 'error': 'New order is required'}), 400
 
     try:
-        new_order = int(new_order_str)
+        # Fractional orders let the client place a card between two neighbours without renumbering
+        new_order = float(new_order_str)
+        if not math.isfinite(new_order):
+            raise ValueError(new_order_str)
+        new_order = int(new_order) if new_order.is_integer() else new_order
     except ValueError:
          logging.warning(f"Card move failed for card '{card_id}': Invalid new_order value '{new_order_str}'.")
-         return jsonify({'success': False, 'error': 'Invalid new order value, must be an integer.'}), 400
+         return jsonify({'success': False, 'error': 'Invalid new order value, must be a number.'}), 400
 
 
     try:
@@ -493,7 +1209,7 @@ def move_card(card_id):
         # A full implementation would shift orders of other cards.
 
         # Update the card's column_id, order, and status
-        result = tasks_collection.update_one(
+        task = tasks_collection.find_one_and_update(
             {'_id': ObjectId(card_id)},
             {'$set': {
                 'column_id': new_column_id,
@@ -501,20 +1217,23 @@ def move_card(card_id):
                 'order': new_order,
                 'updated_at': datetime.utcnow() # Add updated timestamp
                 }
-            }
+            },
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.matched_count == 0:
+        if task is None:
              logging.error(f"Card move failed: Card with ID '{card_id}' not found.")
              return jsonify({'success': False, 'error': 'Card not found'}), 404
-        elif result.modified_count > 0:
-            logging.info(f"Successfully moved card '{card_id}' to column '{new_column_id}' (Name: {new_column['name']}) with order {new_order}.")
-            # Consider returning the updated card data
-            return jsonify({'success': True, 'message': 'Card moved successfully'})
-        else:
-             # Matched but not modified - perhaps data was already the same?
-             logging.info(f"Card '{card_id}' was matched but not modified (already in target state?).")
-             return jsonify({'success': True, 'message': 'Card already in target state'})
+
+        renumbered = renumber_crowded_orders(task)
+        for card in renumbered:
+            if card['id'] == card_id:
+                task['order'] = card['order']
+
+        logging.info(f"Successfully moved card '{card_id}' to column '{new_column_id}' (Name: {new_column['name']}) with order {task['order']}.")
+        # Return the stored card (and any renumbered neighbours) so the client can reconcile its copy
+        return jsonify({'success': True, 'message': 'Card moved successfully', 'card': card_to_json(task, new_column),
+                        'renumbered': renumbered})
 
     # Specific exception for invalid ObjectId format
     except bson.errors.InvalidId:
@@ -712,5 +1431,11 @@ if __name__ == '__main__':
     # Start the Flask application
     # Use host='0.0.0.0' to make it accessible on your network, useful for testing from other devices
     # debug=True automatically reloads on code changes but SHOULD NOT be used in production
+    debug = True
+    # The debug reloader runs this block in a watcher process and again in the serving
+    # process (WERKZEUG_RUN_MAIN=true); only the serving process should archive
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_archive_worker()
+
     logging.info("Flask application starting...")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, debug=debug)
\ No newline at end of file
@@ -0,0 +1,391 @@
+/*
+ * Client-side model and renderer for the Kanban board.
+ *
+ * BoardModel keeps columns and cards keyed by ID so mutations can be applied
+ * locally (and undone) without refetching the board. BoardView keeps a map from
+ * those IDs to DOM nodes and patches only the nodes a mutation touches.
+ * Event handling lives in kanban_board.html and is delegated to the board container,
+ * so nodes created here carry no listeners of their own.
+ */
+(function (root) {
+    const PRIORITIES = ['low', 'medium', 'high'];
+    const PRIORITY_RANK = { high: 3, medium: 2, low: 1 };
+
+    // Same ordering as get_board_data: priority, then order, then card ID, all descending
+    function compareCards(a, b) {
+        return (PRIORITY_RANK[b.priority] || 1) - (PRIORITY_RANK[a.priority] || 1) ||
+            ((b.order || 0) - (a.order || 0)) ||
+            (b.id > a.id ? 1 : b.id < a.id ? -1 : 0);
+    }
+
+    class BoardModel {
+        constructor() {
+            this.columns = [];          // [{ id, name, cardIds: [] }] in board order
+            this.columnsById = new Map();
+            this.cards = new Map();     // card ID -> card data
+            this.cardColumn = new Map(); // card ID -> column ID
+        }
+
+        load(data) {
+            this.columns = [];
+            this.columnsById.clear();
+            this.cards.clear();
+            this.cardColumn.clear();
+            data.columns.forEach(column => this.addColumn(column));
+        }
+
+        addColumn(column, index = this.columns.length) {
+            const entry = { id: column.id, name: column.name, cardIds: [] };
+            this.columns.splice(index, 0, entry);
+            this.columnsById.set(entry.id, entry);
+            (column.cards || []).forEach(card => {
+                this.cards.set(card.id, Object.assign({}, card));
+                this.cardColumn.set(card.id, entry.id);
+                entry.cardIds.push(card.id);
+            });
+            return entry;
+        }
+
+        // Returns a snapshot that restoreColumn() accepts to undo the removal
+        removeColumn(columnId) {
+            const column = this.columnsById.get(columnId);
+            const index = this.columns.indexOf(column);
+            const cards = column.cardIds.map(id => this.cards.get(id));
+            this.columns.splice(index, 1);
+            this.columnsById.delete(columnId);
+            column.cardIds.forEach(id => {
+                this.cards.delete(id);
+                this.cardColumn.delete(id);
+            });
+            return { column: { id: column.id, name: column.name, cards: cards }, index: index };
+        }
+
+        restoreColumn(snapshot) {
+            return this.addColumn(snapshot.column, snapshot.index);
+        }
+
+        getColumn(columnId) {
+            return this.columnsById.get(columnId);
+        }
+
+        columnOf(cardId) {
+            return this.columnsById.get(this.cardColumn.get(cardId));
+        }
+
+        position(cardId) {
+            const column = this.columnOf(cardId);
+            return { columnId: column.id, index: column.cardIds.indexOf(cardId) };
+        }
+
+        // Index at which the server's sort would place card within column
+        sortedIndex(column, card) {
+            const index = column.cardIds.findIndex(id => compareCards(card, this.cards.get(id)) < 0);
+            return index === -1 ? column.cardIds.length : index;
+        }
+
+        nextOrder(columnId) {
+            return this.getColumn(columnId).cardIds.reduce(
+                (max, id) => Math.max(max, this.cards.get(id).order || 0), -1) + 1;
+        }
+
+        addCard(columnId, card, index) {
+            const column = this.getColumn(columnId);
+            this.cards.set(card.id, card);
+            this.cardColumn.set(card.id, columnId);
+            column.cardIds.splice(index === undefined ? this.sortedIndex(column, card) : index, 0, card.id);
+            return card;
+        }
+
+        // Returns { card, columnId, index } so the card can be put back with addCard()
+        removeCard(cardId) {
+            const position = this.position(cardId);
+            const card = this.cards.get(cardId);
+            this.getColumn(position.columnId).cardIds.splice(position.index, 1);
+            this.cards.delete(cardId);
+            this.cardColumn.delete(cardId);
+            return Object.assign({ card: card }, position);
+        }
+
+        // Move a card to the slot it was dropped on. The card gets an order between its
+        // same-priority neighbours there and is then re-sorted, so it ends up where the
+        // server's sort will show it. Returns the previous { columnId, index, order, status }.
+        moveCard(cardId, columnId, index) {
+            const card = this.cards.get(cardId);
+            const previous = Object.assign({ order: card.order, status: card.status }, this.position(cardId));
+            const target = this.getColumn(columnId);
+            this.getColumn(previous.columnId).cardIds.splice(previous.index, 1);
+            index = Math.min(index, target.cardIds.length);
+
+            const sameGroup = id => id !== undefined && this.cards.get(id).priority === card.priority;
+            const above = sameGroup(target.cardIds[index - 1]) ? this.cards.get(target.cardIds[index - 1]) : null;
+            const below = sameGroup(target.cardIds[index]) ? this.cards.get(target.cardIds[index]) : null;
+            if (above && below) {
+                card.order = ((above.order || 0) + (below.order || 0)) / 2;
+            } else if (above) {
+                card.order = (above.order || 0) - 1;
+            } else if (below) {
+                card.order = (below.order || 0) + 1;
+            } else if (columnId !== previous.columnId) {
+                // Dropped outside its priority group: put it at the top of the group
+                card.order = this.nextOrder(columnId);
+            }
+
+            card.status = target.name;
+            this.cardColumn.set(cardId, columnId);
+            target.cardIds.splice(this.sortedIndex(target, card), 0, cardId);
+            return previous;
+        }
+
+        restoreMove(cardId, previous) {
+            const card = this.cards.get(cardId);
+            const column = this.columnOf(cardId);
+            column.cardIds.splice(column.cardIds.indexOf(cardId), 1);
+            this.getColumn(previous.columnId).cardIds.splice(previous.index, 0, cardId);
+            this.cardColumn.set(cardId, previous.columnId);
+            card.order = previous.order;
+            card.status = previous.status;
+        }
+
+        // Take the server's copy of a card and re-sort it into place
+        applyServerCard(serverCard) {
+            const card = Object.assign(this.cards.get(serverCard.id), serverCard);
+            const column = this.columnOf(card.id);
+            column.cardIds.splice(column.cardIds.indexOf(card.id), 1);
+            const target = this.getColumn(serverCard.column_id) || column;
+            this.cardColumn.set(card.id, target.id);
+            target.cardIds.splice(this.sortedIndex(target, card), 0, card.id);
+            return card;
+        }
+
+        // Take orders the server renumbered ([{ id, order }]) and re-sort the columns they
+        // are in; returns the IDs of those columns
+        applyOrders(orders) {
+            const columnIds = new Set();
+            orders.forEach(({ id, order }) => {
+                const card = this.cards.get(id);
+                if (card) {
+                    card.order = order;
+                    columnIds.add(this.cardColumn.get(id));
+                }
+            });
+            columnIds.forEach(columnId => {
+                this.getColumn(columnId).cardIds.sort((a, b) => compareCards(this.cards.get(a), this.cards.get(b)));
+            });
+            return [...columnIds];
+        }
+
+        // Re-sorts the card within its column; returns the previous { priority, index }
+        setPriority(cardId, priority) {
+            const card = this.cards.get(cardId);
+            const column = this.columnOf(cardId);
+            const previous = { priority: card.priority, index: column.cardIds.indexOf(cardId) };
+            column.cardIds.splice(previous.index, 1);
+            card.priority = priority;
+            column.cardIds.splice(this.sortedIndex(column, card), 0, cardId);
+            return previous;
+        }
+
+        restorePriority(cardId, previous) {
+            const card = this.cards.get(cardId);
+            const column = this.columnOf(cardId);
+            column.cardIds.splice(column.cardIds.indexOf(cardId), 1);
+            card.priority = previous.priority;
+            column.cardIds.splice(previous.index, 0, cardId);
+        }
+
+        // Swap a placeholder card for the one the server created
+        replaceCard(oldId, serverCard) {
+            const column = this.columnOf(oldId);
+            const card = this.cards.get(oldId);
+            delete card.pending;
+            card.id = serverCard.id;
+            column.cardIds[column.cardIds.indexOf(oldId)] = card.id;
+            this.cards.delete(oldId);
+            this.cardColumn.delete(oldId);
+            this.cards.set(card.id, card);
+            this.cardColumn.set(card.id, column.id);
+            return this.applyServerCard(serverCard);
+        }
+    }
+
+    class BoardView {
+        constructor(container, doc) {
+            this.container = container;
+            this.doc = doc || root.document;
+            this.columnElements = new Map();
+            this.cardElements = new Map();
+        }
+
+        render(model) {
+            this.container.innerHTML = '';
+            this.columnElements.clear();
+            this.cardElements.clear();
+            model.columns.forEach(column => this.container.appendChild(this.createColumnElement(model, column)));
+        }
+
+        createColumnElement(model, column) {
+            const columnDiv = this.doc.createElement('div');
+            columnDiv.classList.add('column');
+            columnDiv.dataset.columnId = column.id;
+
+            const deleteButton = this.doc.createElement('button');
+            deleteButton.classList.add('delete-column-button');
+            deleteButton.textContent = '🗑️';
+            columnDiv.appendChild(deleteButton);
+
+            const columnTitle = this.doc.createElement('h2');
+            columnTitle.textContent = column.name;
+            columnDiv.appendChild(columnTitle);
+
+            column.cardIds.forEach(cardId => {
+                columnDiv.appendChild(this.createCardElement(model.cards.get(cardId), column.name));
+            });
+
+            this.columnElements.set(column.id, columnDiv);
+            return columnDiv;
+        }
+
+        createCardElement(card, columnName) {
+            const cardDiv = this.doc.createElement('div');
+            cardDiv.classList.add('card', card.priority || 'low'); // Default to 'low' if no priority
+            cardDiv.dataset.cardId = card.id;
+            cardDiv.draggable = !card.pending; // Placeholder cards can't move until the server has saved them
+            if (columnName === 'Done') {
+                cardDiv.classList.add('done');
+            }
+
+            const cardHeader = this.doc.createElement('div');
+            cardHeader.classList.add('card-header');
+            const titleSpan = this.doc.createElement('span');
+            titleSpan.classList.add('card-title');
+            titleSpan.textContent = card.title;
+            cardHeader.appendChild(titleSpan);
+
+            const deleteButton = this.doc.createElement('button');
+            deleteButton.classList.add('delete-button');
+            deleteButton.textContent = 'Delete';
+            cardHeader.appendChild(deleteButton);
+            cardDiv.appendChild(cardHeader);
+
+            const taskIdDiv = this.doc.createElement('div');
+            taskIdDiv.classList.add('card-details', 'card-task-id');
+            taskIdDiv.textContent = `Task ID: ${card.task_id || '…'}`;
+            cardDiv.appendChild(taskIdDiv);
+
+            if (card.assignee) {
+                const assigneeDiv = this.doc.createElement('div');
+                assigneeDiv.classList.add('card-details');
+                assigneeDiv.textContent = `Assignee: ${card.assignee}`;
+                cardDiv.appendChild(assigneeDiv);
+            }
+
+            if (card.due_date) {
+                const dueDateDiv = this.doc.createElement('div');
+                dueDateDiv.classList.add('card-details');
+                dueDateDiv.textContent = `Due Date: ${new Date(card.due_date).toLocaleDateString()}`;
+                cardDiv.appendChild(dueDateDiv);
+            }
+
+            const priorityDropdown = this.doc.createElement('select');
+            priorityDropdown.classList.add('priority-dropdown');
+            PRIORITIES.forEach(priority => {
+                const option = this.doc.createElement('option');
+                option.value = priority;
+                option.textContent = priority.charAt(0).toUpperCase() + priority.slice(1);
+                priorityDropdown.appendChild(option);
+            });
+            priorityDropdown.value = card.priority || 'low';
+            priorityDropdown.disabled = Boolean(card.pending);
+            cardDiv.appendChild(priorityDropdown);
+
+            const showDescriptionButton = this.doc.createElement('button');
+            showDescriptionButton.textContent = 'Show Description';
+            showDescriptionButton.classList.add('show-description-button');
+            cardDiv.appendChild(showDescriptionButton);
+
+            this.cardElements.set(card.id, cardDiv);
+            return cardDiv;
+        }
+
+        insertColumn(model, columnId) {
+            const index = model.columns.findIndex(column => column.id === columnId);
+            const next = model.columns[index + 1];
+            const columnDiv = this.createColumnElement(model, model.columns[index]);
+            this.container.insertBefore(columnDiv, next ? this.columnElements.get(next.id) : null);
+        }
+
+        removeColumn(columnId, cardIds) {
+            const columnDiv = this.columnElements.get(columnId);
+            cardIds.forEach(id => this.cardElements.delete(id));
+            this.columnElements.delete(columnId);
+            this.container.removeChild(columnDiv);
+        }
+
+        insertCard(model, cardId) {
+            const column = model.columnOf(cardId);
+            this.createCardElement(model.cards.get(cardId), column.name);
+            this.placeCard(model, cardId);
+        }
+
+        removeCard(cardId) {
+            const cardDiv = this.cardElements.get(cardId);
+            this.cardElements.delete(cardId);
+            if (cardDiv.parentNode) {
+                cardDiv.parentNode.removeChild(cardDiv);
+            }
+        }
+
+        // Put the card's node where the model says it belongs; also undoes drag previews
+        placeCard(model, cardId) {
+            const column = model.columnOf(cardId);
+            const cardDiv = this.cardElements.get(cardId);
+            const index = column.cardIds.indexOf(cardId);
+            const nextId = column.cardIds[index + 1];
+            const columnDiv = this.columnElements.get(column.id);
+            columnDiv.insertBefore(cardDiv, nextId !== undefined ? this.cardElements.get(nextId) : null);
+            if (column.name === 'Done') {
+                cardDiv.classList.add('done');
+            } else {
+                cardDiv.classList.remove('done');
+            }
+        }
+
+        // Put every card node of the column in model order, working up from the bottom
+        reorderColumn(model, columnId) {
+            const column = model.getColumn(columnId);
+            const columnDiv = this.columnElements.get(columnId);
+            let next = null;
+            for (let i = column.cardIds.length - 1; i >= 0; i--) {
+                const cardDiv = this.cardElements.get(column.cardIds[i]);
+                columnDiv.insertBefore(cardDiv, next);
+                next = cardDiv;
+            }
+        }
+
+        updateCard(model, cardId) {
+            const card = model.cards.get(cardId);
+            const cardDiv = this.cardElements.get(cardId);
+            PRIORITIES.forEach(priority => cardDiv.classList.remove(priority));
+            cardDiv.classList.add(card.priority || 'low');
+            cardDiv.draggable = !card.pending;
+            const priorityDropdown = cardDiv.querySelector('.priority-dropdown');
+            priorityDropdown.value = card.priority || 'low';
+            priorityDropdown.disabled = Boolean(card.pending);
+            cardDiv.querySelector('.card-task-id').textContent = `Task ID: ${card.task_id || '…'}`;
+        }
+
+        renameCard(oldId, newId) {
+            const cardDiv = this.cardElements.get(oldId);
+            this.cardElements.delete(oldId);
+            this.cardElements.set(newId, cardDiv);
+            cardDiv.dataset.cardId = newId;
+        }
+    }
+
+    const api = { BoardModel: BoardModel, BoardView: BoardView, compareCards: compareCards };
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = api;
+    } else {
+        root.KanbanBoard = api;
+    }
+})(typeof window !== 'undefined' ? window : globalThis);